@@ -0,0 +1,26 @@
+"""Build hook: AOT-compile the Numba kernels (optional, falls back to JIT)."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# The kernels are imported here under a different module name than at
+# runtime, so keep numba's on-disk cache away from the package's
+os.environ.setdefault('NUMBA_CACHE_DIR', tempfile.mkdtemp())
+
+# Import the kernels directly so building does not need the plotting and
+# NetCDF dependencies pulled in by batara_guru/__init__.py
+sys.path.insert(0, str(Path(__file__).parent / 'src' / 'batara_guru' / 'core'))
+
+
+def build():
+    try:
+        from _kernels_aot import cc
+        cc.compile()
+    except Exception as e:
+        print(f"WARNING: AOT kernel build failed, using JIT: {e}")
+
+
+if __name__ == '__main__':
+    build()
@@ -39,6 +39,18 @@ def normalize_scenario_name(scenario_name: str) -> str:
     return clean
 
 
+def _apply_cli_overrides(config: dict, args) -> None:
+    """Apply command-line options on top of a loaded configuration."""
+    if args.dpi:
+        config['plot_dpi'] = args.dpi
+    if args.pretty:
+        config['plot_style'] = 'pretty'
+    if args.specialize:
+        config['specialize'] = True
+    if args.dpi and config.get('plot_style', 'fast') != 'pretty':
+        print("WARNING: --dpi only applies to plot_style = pretty (--pretty)")
+
+
 def run_scenario(config: dict, output_dir: str = "outputs",
                 verbose: bool = True, n_cores: int = None):
     """Run complete Rule 30 simulation scenario."""
@@ -67,9 +79,16 @@ def run_scenario(config: dict, output_dir: str = "outputs",
                 steps=config.get('time_steps', 250),
                 verbose=verbose,
                 logger=logger,
-                n_cores=n_cores
+                n_cores=n_cores,
+                specialize=config.get('specialize', False)
             )
         
+        # Grid history is only needed for NetCDF and plots
+        save_grid = config.get(
+            'save_grid',
+            config.get('save_netcdf', True) or config.get('save_plot', True)
+        )
+        
         # Run simulation
         with timer.time_section("simulation"):
             if verbose:
@@ -78,7 +97,8 @@ def run_scenario(config: dict, output_dir: str = "outputs",
             result = solver.evolve(
                 initial_condition=config.get('initial_condition', 'single'),
                 center_position=config.get('center_position', None),
-                show_progress=verbose
+                show_progress=verbose,
+                keep_grid=save_grid
             )
             
             logger.log_results(result)
@@ -105,27 +125,33 @@ def run_scenario(config: dict, output_dir: str = "outputs",
             )
             
             if verbose:
-                print(f"       ✓ Saved: {entropy_file.name}")
-                print(f"       ✓ Saved: {complexity_file.name}")
-                print(f"       ✓ Saved: {composite_file.name}")
+                for csv_file in dict.fromkeys(
+                        [entropy_file, complexity_file, composite_file]):
+                    print(f"       ✓ Saved: {csv_file.name}")
         
         # Create plot
-        if config.get('save_plot', True):
+        if config.get('save_plot', True) and result['grid'] is None:
+            logger.warning("save_plot requires save_grid = true; skipping plot")
+        elif config.get('save_plot', True):
             with timer.time_section("plot"):
                 if verbose:
                     print("\n[5/5] Creating spatio-temporal plot...")
                 
                 filename = f"{clean_name}.png"
-                dpi = config.get('plot_dpi', 350)
-                colormap = config.get('colormap', 'binary')
                 
-                Plotter.create_plot(
-                    result,
-                    filename,
-                    output_dir,
-                    dpi,
-                    colormap
-                )
+                if config.get('plot_style', 'fast') == 'pretty':
+                    dpi = config.get('plot_dpi', 350)
+                    colormap = config.get('colormap', 'binary')
+                    
+                    Plotter.create_plot(
+                        result,
+                        filename,
+                        output_dir,
+                        dpi,
+                        colormap
+                    )
+                else:
+                    Plotter.create_plot_fast(result, filename, output_dir)
         
         timer.stop("total")
         logger.log_timing(timer.get_times())
@@ -205,6 +231,18 @@ def main():
         help='Plot DPI (overrides config)'
     )
     
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Matplotlib publication plot instead of the fast raster'
+    )
+    
+    parser.add_argument(
+        '--specialize',
+        action='store_true',
+        help='Compile a kernel for the exact grid width (not cached)'
+    )
+    
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -219,8 +257,7 @@ def main():
     
     if args.config:
         config = ConfigManager.load(args.config)
-        if args.dpi:
-            config['plot_dpi'] = args.dpi
+        _apply_cli_overrides(config, args)
         run_scenario(config, args.output_dir, verbose, args.cores)
     
     elif args.all:
@@ -238,8 +275,7 @@ def main():
                 print(f"{'#' * 70}")
             
             config = ConfigManager.load(str(cfg_file))
-            if args.dpi:
-                config['plot_dpi'] = args.dpi
+            _apply_cli_overrides(config, args)
             run_scenario(config, args.output_dir, verbose, args.cores)
     
     elif args.case:
@@ -249,8 +285,7 @@ def main():
         
         if cfg_file.exists():
             config = ConfigManager.load(str(cfg_file))
-            if args.dpi:
-                config['plot_dpi'] = args.dpi
+            _apply_cli_overrides(config, args)
             run_scenario(config, args.output_dir, verbose, args.cores)
         else:
             print(f"ERROR: Configuration file not found: {cfg_file}")
@@ -0,0 +1,45 @@
+"""
+Ahead-of-time build of the Rule 30 kernels.
+Running cc.compile() (see build.py) emits batara_guru.core._ca_kernels.
+It is built for pycc's generic CPU (no POPCNT/AVX), so solver.py only
+uses it while the JIT kernel is not in Numba's on-disk cache yet, and
+only if its source_hash() matches the installed sources.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+try:
+    from . import solver
+except ImportError:
+    # Imported from build.py without the (runtime-heavy) package __init__
+    import solver
+
+cc = CC('_ca_kernels')
+cc.output_dir = str(Path(__file__).parent)
+
+
+def _serial(func):
+    """
+    Rebind a kernel so its threaded step resolves to the serial one.
+    Parallel (prange) code cannot be linked into a pycc module; the
+    solver only uses the AOT kernel when n_tiles == 1 anyway.
+    """
+    return solver._rebind(
+        func, apply_rule30_bits_parallel=solver._apply_rule30_bits_tiled
+    )
+
+
+cc.export(
+    'evolve_and_measure',
+    'void(u8[::1], u8[::1], i8, i8, i8, f8[::1], f8[::1], f8[::1], '
+    'f8[::1], b1, u8[:, ::1], i8)'
+)(_serial(solver.evolve_and_measure))
+
+_SOURCE_HASH = solver._source_hash()
+
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return _SOURCE_HASH
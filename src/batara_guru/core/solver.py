@@ -3,95 +3,433 @@ Rule 30 Cellular Automaton Solver with Parallel Processing
 Implements Rule 30: 00011110 in binary
 """
 
+import hashlib
 import numpy as np
-from numba import jit, prange
+from pathlib import Path
+from numba import jit, prange, types
+from numba.extending import intrinsic
 import numba
-import os
+import threading
+import types as pytypes
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 from tqdm import tqdm
 
 
+# Unpacked int8 kernels: kept as the public reference API for callers
+# stepping a single row; Rule30Solver uses the packed kernels below
 @jit(nopython=True, cache=True)
-def apply_rule30(state: np.ndarray) -> np.ndarray:
+def apply_rule30_into(state: np.ndarray, new_state: np.ndarray):
     """
-    Apply Rule 30 to current state.
+    Apply Rule 30 to current state, writing into new_state.
     Rule 30: 111→0, 110→0, 101→0, 100→1, 011→1, 010→1, 001→1, 000→0
+    which is exactly new = left ^ (center | right).
     """
     n = len(state)
-    new_state = np.zeros(n, dtype=np.int8)
-    
-    for i in range(n):
-        left = state[(i - 1) % n]
-        center = state[i]
-        right = state[(i + 1) % n]
-        
-        # Rule 30 lookup
-        pattern = left * 4 + center * 2 + right
-        
-        if pattern == 0:    # 000
-            new_state[i] = 0
-        elif pattern == 1:  # 001
-            new_state[i] = 1
-        elif pattern == 2:  # 010
-            new_state[i] = 1
-        elif pattern == 3:  # 011
-            new_state[i] = 1
-        elif pattern == 4:  # 100
-            new_state[i] = 1
-        elif pattern == 5:  # 101
-            new_state[i] = 0
-        elif pattern == 6:  # 110
-            new_state[i] = 0
-        elif pattern == 7:  # 111
-            new_state[i] = 0
     
+    # Periodic edges handled separately so the interior loop has no
+    # modulo and can be auto-vectorized
+    new_state[0] = state[n - 1] ^ (state[0] | state[1 % n])
+    
+    for i in range(1, n - 1):
+        new_state[i] = state[i - 1] ^ (state[i] | state[i + 1])
+    
+    if n > 1:
+        new_state[n - 1] = state[n - 2] ^ (state[n - 1] | state[0])
+
+
+@jit(nopython=True, cache=True)
+def apply_rule30(state: np.ndarray) -> np.ndarray:
+    """Apply Rule 30 to current state and return the next state."""
+    # Every cell is overwritten, so no zero-fill is needed
+    new_state = np.empty(len(state), dtype=np.int8)
+    apply_rule30_into(state, new_state)
     return new_state
 
 
+@jit(nopython=True, cache=True)
+def _get_bit(words: np.ndarray, j: int) -> np.uint64:
+    """Read cell j from a packed row (MSB-first within each word)."""
+    return (words[j >> 6] >> np.uint64(63 - (j & 63))) & np.uint64(1)
+
+
+@jit(nopython=True, cache=True)
+def _rule30_word(prev: np.uint64, c: np.uint64, nxt: np.uint64) -> np.uint64:
+    """
+    Next generation of word c given its neighbouring words. Scalars are
+    passed (not the row) so the call inlines into a vectorizable loop.
+    """
+    one = np.uint64(1)
+    s63 = np.uint64(63)
+    left = (c >> one) | (prev << s63)
+    right = (c << one) | (nxt >> s63)
+    return left ^ (c | right)
+
+
+@jit(nopython=True, cache=True, inline='always')
+def _rule30_words(words_in: np.ndarray, words_out: np.ndarray,
+                  lo: int, hi: int):
+    """Step words lo..hi-1 with zero halos past either end of the row."""
+    last = words_in.shape[0] - 1
+    zero = np.uint64(0)
+    for i in range(lo, hi):
+        prev = words_in[i - 1] if i > 0 else zero
+        nxt = words_in[i + 1] if i < last else zero
+        words_out[i] = _rule30_word(prev, words_in[i], nxt)
+
+
+@jit(nopython=True, cache=True)
+def _wrap_edges(words_in: np.ndarray, words_out: np.ndarray, w: int):
+    """Recompute the two edge cells from their toroidal neighbours."""
+    nw = words_in.shape[0]
+    last = nw - 1
+    one = np.uint64(1)
+    s63 = np.uint64(63)
+    
+    first_cell = _get_bit(words_in, (w - 1) % w) ^ (
+        _get_bit(words_in, 0) | _get_bit(words_in, 1 % w))
+    last_cell = _get_bit(words_in, (w - 2) % w) ^ (
+        _get_bit(words_in, w - 1) | _get_bit(words_in, 0))
+    
+    words_out[0] = (words_out[0] & ~(one << s63)) | (first_cell << s63)
+    tail = np.uint64(64 * nw - w)
+    words_out[last] = (words_out[last] & ~(one << tail)) | (last_cell << tail)
+    
+    # Keep padding bits beyond the grid width cleared
+    words_out[last] &= ~np.uint64(0) << tail
+
+
+@jit(nopython=True, cache=True)
+def apply_rule30_bits(words_in: np.ndarray, words_out: np.ndarray, w: int):
+    """
+    Apply Rule 30 to a bit-packed state, 64 cells per uint64 word.
+    Cell j lives in word j // 64 at bit 63 - j % 64, so the left
+    neighbour of every cell is obtained with a single right shift.
+    Rule 30: new = left ^ (center | right)
+    """
+    _rule30_words(words_in, words_out, 0, words_in.shape[0])
+    _wrap_edges(words_in, words_out, w)
+
+
+@jit(nopython=True, cache=True)
+def _apply_rule30_bits_tiled(words_in: np.ndarray, words_out: np.ndarray,
+                             w: int, n_tiles: int):
+    """Serial stand-in for apply_rule30_bits_parallel (AOT builds)."""
+    apply_rule30_bits(words_in, words_out, w)
+
+
 @jit(nopython=True, parallel=True, cache=True)
+def apply_rule30_bits_parallel(words_in: np.ndarray, words_out: np.ndarray,
+                               w: int, n_tiles: int):
+    """
+    Multi-threaded apply_rule30_bits. The row is split into n_tiles
+    contiguous tiles of words (one per thread); tiles read their one-word
+    halos from the frozen input and write disjoint slices of the output.
+    """
+    nw = words_in.shape[0]
+    tile = (nw + n_tiles - 1) // n_tiles
+    
+    for k in prange(n_tiles):
+        lo = k * tile
+        _rule30_words(words_in, words_out, lo, min(lo + tile, nw))
+    
+    _wrap_edges(words_in, words_out, w)
+
+
+@intrinsic
+def _ctpop64(typingctx, x):
+    """LLVM ctpop on a uint64; lowers to POPCNT where available."""
+    sig = types.uint64(types.uint64)
+    
+    def codegen(context, builder, signature, args):
+        return builder.ctpop(args[0])
+    
+    return sig, codegen
+
+
+if numba.config.DISABLE_JIT:
+    # Intrinsics have no pure-Python form; keep NUMBA_DISABLE_JIT usable
+    def _ctpop64(x):
+        return np.uint64(bin(int(x)).count('1'))
+
+
+@jit(nopython=True, cache=True)
+def _popcount64(x: np.uint64) -> int:
+    """Count set bits in a 64-bit word."""
+    return int(_ctpop64(x))
+
+
+@jit(nopython=True, cache=True)
+def _row_counts(words: np.ndarray, w: int) -> tuple:
+    """
+    Count live cells and periodic neighbour transitions in a packed row.
+    Each cell is XORed with its right neighbour, so transitions are a
+    popcount of the difference word.
+    """
+    nw = words.shape[0]
+    last = nw - 1
+    one = np.uint64(1)
+    s63 = np.uint64(63)
+    tail = np.uint64(64 * nw - w)
+    
+    n_ones = 0
+    transitions = 0
+    for i in range(nw):
+        c = words[i]
+        right = c << one
+        if i < last:
+            right |= words[i + 1] >> s63
+        diff = c ^ right
+        if i == last:
+            # Cell w-1 is compared with cell 0 below
+            diff &= ~(one << tail)
+        n_ones += _popcount64(c)
+        transitions += _popcount64(diff)
+    
+    transitions += int(_get_bit(words, w - 1) ^ _get_bit(words, 0))
+    return n_ones, transitions
+
+
+def entropy_table(width: int) -> np.ndarray:
+    """
+    Binary Shannon entropy for every possible live-cell count 0..width,
+    so per-row entropy is a single lookup instead of two log2 calls.
+    """
+    p_one = np.arange(width + 1) / width
+    p_zero = 1.0 - p_one
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table = -p_one * np.log2(p_one) - p_zero * np.log2(p_zero)
+    table[0] = 0.0
+    table[width] = 0.0
+    return table
+
+
+# Layout of the running-statistics array used by evolve_and_measure
+(STAT_COUNT, STAT_MEAN_E, STAT_M2_E,
+ STAT_MEAN_C, STAT_M2_C, STAT_N_ONES) = range(6)
+
+
+@jit(nopython=True, cache=True)
+def _record(t: int, n_ones: int, transitions: int, w: int,
+            h_table: np.ndarray, entropy_out: np.ndarray,
+            complexity_out: np.ndarray, stats: np.ndarray):
+    """Store generation t's metrics and fold them into Welford sums."""
+    entropy_out[t] = h_table[n_ones]
+    complexity_out[t] = transitions / w
+    entropy = np.float64(entropy_out[t])
+    complexity = np.float64(complexity_out[t])
+    
+    stats[STAT_COUNT] += 1.0
+    k = stats[STAT_COUNT]
+    delta = entropy - stats[STAT_MEAN_E]
+    stats[STAT_MEAN_E] += delta / k
+    stats[STAT_M2_E] += delta * (entropy - stats[STAT_MEAN_E])
+    delta = complexity - stats[STAT_MEAN_C]
+    stats[STAT_MEAN_C] += delta / k
+    stats[STAT_M2_C] += delta * (complexity - stats[STAT_MEAN_C])
+    stats[STAT_N_ONES] = n_ones
+
+
+@jit(nopython=True, cache=True)
+def evolve_and_measure(state: np.ndarray, scratch: np.ndarray, w: int,
+                       t0: int, t1: int, h_table: np.ndarray,
+                       entropy_out: np.ndarray, complexity_out: np.ndarray,
+                       stats: np.ndarray, keep_grid: bool,
+                       grid_out: np.ndarray, n_tiles: int = 1):
+    """
+    Advance a packed state from generation t0 to t1 in place, measuring
+    every generation in the same pass. state and scratch are the two
+    rolling rows; rows are copied into grid_out when keep_grid is set.
+    Entropy is looked up in h_table (see entropy_table). Running
+    mean/variance and the live-cell count of the latest row are
+    accumulated in stats (see STAT_*). Generation t0 itself is measured
+    only when t0 == 0. With n_tiles > 1 each step is spread across
+    threads (worth it for wide grids).
+    """
+    cur = state
+    nxt = scratch
+    
+    if t0 == 0:
+        n_ones, transitions = _row_counts(cur, w)
+        _record(0, n_ones, transitions, w,
+                h_table, entropy_out, complexity_out, stats)
+        if keep_grid:
+            grid_out[0] = cur
+    
+    for t in range(t0 + 1, t1 + 1):
+        if n_tiles > 1:
+            apply_rule30_bits_parallel(cur, nxt, w, n_tiles)
+        else:
+            apply_rule30_bits(cur, nxt, w)
+        
+        n_ones, transitions = _row_counts(nxt, w)
+        _record(t, n_ones, transitions, w,
+                h_table, entropy_out, complexity_out, stats)
+        if keep_grid:
+            grid_out[t] = nxt
+        
+        cur, nxt = nxt, cur
+    
+    # After an odd number of swaps the latest row is in the scratch buffer
+    if (t1 - t0) % 2 == 1:
+        state[:] = cur
+
+
+def _rebind(func, **replacements):
+    """Copy a jitted kernel's Python function with some globals replaced."""
+    py_func = func.py_func
+    env = dict(py_func.__globals__)
+    env.update(replacements)
+    return pytypes.FunctionType(py_func.__code__, env, py_func.__name__,
+                                py_func.__defaults__, py_func.__closure__)
+
+
+_kernel_cache = {}
+
+
+def get_kernel(width: int):
+    """
+    Return an evolve_and_measure variant specialized for one width.
+    The word count, tail offset and edge positions become compile-time
+    constants, letting LLVM unroll and vectorize with a fixed trip
+    count. Specialized kernels cannot be cached on disk, so each new
+    width costs a fresh compile; they are memoized per process.
+    Under NUMBA_DISABLE_JIT the plain kernel is returned.
+    """
+    if numba.config.DISABLE_JIT:
+        return evolve_and_measure
+    
+    if width not in _kernel_cache:
+        nw = (width + 63) // 64
+        
+        @jit(nopython=True)
+        def step(words_in, words_out, w):
+            _rule30_words(words_in, words_out, 0, nw)
+            _wrap_edges(words_in, words_out, width)
+        
+        _kernel_cache[width] = jit(nopython=True)(
+            _rebind(evolve_and_measure, apply_rule30_bits=step)
+        )
+    return _kernel_cache[width]
+
+
+@contextmanager
+def _num_threads(n: int):
+    """Temporarily set Numba's thread count, restoring it on exit."""
+    previous = numba.get_num_threads()
+    numba.set_num_threads(n)
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
+def pack_state(state: np.ndarray) -> np.ndarray:
+    """Pack int8 {0,1} cells (any leading shape) into MSB-first uint64 words."""
+    nw = (state.shape[-1] + 63) // 64
+    packed = np.packbits(state, axis=-1)
+    buf = np.zeros(state.shape[:-1] + (nw * 8,), dtype=np.uint8)
+    buf[..., :packed.shape[-1]] = packed
+    return buf.view('>u8').astype(np.uint64)
+
+
+def unpack_grid(words: np.ndarray, width: int) -> np.ndarray:
+    """Unpack uint64 words (any leading shape) back to int8 cells."""
+    as_bytes = np.ascontiguousarray(words, dtype='>u8').view(np.uint8)
+    return np.unpackbits(as_bytes, axis=-1, count=width).view(np.int8)
+
+
 def compute_metrics_parallel(grid: np.ndarray) -> tuple:
     """
     Compute entropy and complexity for all timesteps in parallel.
     """
-    steps, width = grid.shape
+    width = grid.shape[1]
+    return _compute_metrics(pack_state(grid), width, entropy_table(width))
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _compute_metrics(words: np.ndarray, w: int, h_table: np.ndarray) -> tuple:
+    """Per-row popcount kernel behind compute_metrics_parallel."""
+    steps = words.shape[0]
     entropy_values = np.zeros(steps)
     complexity_values = np.zeros(steps)
     
     for t in prange(steps):
-        state = grid[t]
-        
-        # Shannon entropy
-        n_ones = np.sum(state)
-        n_zeros = width - n_ones
-        
-        if n_ones > 0 and n_zeros > 0:
-            p_one = n_ones / width
-            p_zero = n_zeros / width
-            entropy = -p_one * np.log2(p_one) - p_zero * np.log2(p_zero)
-        else:
-            entropy = 0.0
-        
-        entropy_values[t] = entropy
-        
-        # Local complexity (transitions)
-        transitions = 0
-        for i in range(width - 1):
-            if state[i] != state[i + 1]:
-                transitions += 1
-        if state[-1] != state[0]:
-            transitions += 1
-        
-        complexity_values[t] = transitions / width
+        n_ones, transitions = _row_counts(words[t], w)
+        entropy_values[t] = h_table[n_ones]
+        complexity_values[t] = transitions / w
     
     return entropy_values, complexity_values
 
 
+def _source_hash() -> int:
+    """Hash of the sources the AOT kernels are built from."""
+    digest = hashlib.sha256()
+    for name in ('solver.py', '_kernels_aot.py'):
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return int.from_bytes(digest.digest()[:8], 'little', signed=True)
+
+
+# Ahead-of-time compiled kernels (see _kernels_aot.py); JIT otherwise.
+# A module built from other sources (e.g. a stale in-tree build) is ignored
+try:
+    from . import _ca_kernels
+except ImportError:
+    _ca_kernels = None
+
+if _ca_kernels is not None and _ca_kernels.source_hash() == _source_hash():
+    _evolve_and_measure_aot = _ca_kernels.evolve_and_measure
+else:
+    _evolve_and_measure_aot = None
+
+
+def _jit_is_cold(kernel, args: tuple) -> bool:
+    """
+    True if calling kernel with args would compile: it is neither
+    compiled in this process nor in Numba's on-disk cache. Anything
+    unexpected (e.g. NUMBA_DISABLE_JIT) counts as warm.
+    """
+    try:
+        sig = tuple(numba.typeof(a) for a in args)
+        if sig in kernel.overloads:
+            return False
+        cache = kernel._cache
+        key = cache._index_key(sig, kernel.targetctx.codegen())
+        return key not in cache._cache_file._load_index()
+    except AttributeError:
+        return False
+
+
+_background_compile = None
+
+
+def _compile_in_background(kernel, args: tuple):
+    """
+    Compile (and cache on disk) kernel for args in a worker thread. The
+    thread is not a daemon, so a short run still waits for the cache to
+    be written before the interpreter exits.
+    """
+    global _background_compile
+    if _background_compile is None or not _background_compile.is_alive():
+        sig = tuple(numba.typeof(a) for a in args)
+        _background_compile = threading.Thread(
+            target=kernel.compile, args=(sig,), name='numba-compile'
+        )
+        _background_compile.start()
+
+
+# Below this many packed words per row, thread start-up costs more than
+# a serial step (~4096 words = 262144 cells)
+PARALLEL_MIN_WORDS = 4096
+
+
 class Rule30Solver:
     """Rule 30 cellular automaton solver with parallel processing."""
     
     def __init__(self, width: int = 501, steps: int = 250, 
                  verbose: bool = True, logger: Optional[Any] = None,
-                 n_cores: Optional[int] = None):
+                 n_cores: Optional[int] = None,
+                 specialize: bool = False):
         """
         Initialize Rule 30 solver with parallel processing.
         
@@ -101,16 +439,48 @@ class Rule30Solver:
             verbose: Print progress messages
             logger: Optional logger instance
             n_cores: Number of CPU cores (None = all available)
+            specialize: Compile a kernel for this exact width (faster
+                steps, but an uncached compile per new width)
         """
         self.width = width
         self.steps = steps
         self.verbose = verbose
         self.logger = logger
+        self._entropy_table = entropy_table(width)
+        self._kernel = get_kernel(width) if specialize else None
         
-        # Set number of threads
+        # Thread count is applied only while evolving (see _num_threads),
+        # so scenarios and callers do not leak it into each other
         if n_cores is None:
-            n_cores = os.cpu_count()
-        numba.set_num_threads(n_cores)
+            n_cores = numba.config.NUMBA_NUM_THREADS
+        n_cores = max(1, min(n_cores, numba.config.NUMBA_NUM_THREADS))
+        self.n_cores = n_cores
+        
+        # Pick the evolution kernel once; space decomposition across
+        # threads only pays off for wide rows
+        n_words = (width + 63) // 64
+        if n_words >= PARALLEL_MIN_WORDS:
+            self._n_tiles = n_cores
+        else:
+            self._n_tiles = 1
+        
+        warm_up_args = self._warm_up_args(n_words)
+        if self._kernel is not None and self._n_tiles == 1:
+            self._evolve_kernel = self._kernel
+        elif (_evolve_and_measure_aot is not None and self._n_tiles == 1
+              and _jit_is_cold(evolve_and_measure, warm_up_args)):
+            # The AOT build targets a generic CPU (several times slower
+            # than the JIT), so it only covers the first run after
+            # install while the JIT kernel compiles into the cache
+            self._evolve_kernel = _evolve_and_measure_aot
+            _compile_in_background(evolve_and_measure, warm_up_args)
+        else:
+            self._evolve_kernel = evolve_and_measure
+        
+        # Compile/load the kernel now so evolve() starts in machine code
+        if not numba.config.DISABLE_JIT:
+            with _num_threads(self.n_cores):
+                self._evolve_kernel(*warm_up_args)
         
         if verbose:
             print(f"  Grid: {width} cells")
@@ -118,9 +488,21 @@ class Rule30Solver:
             print(f"  Rule: 30 (00011110)")
             print(f"  CPU cores: {n_cores}")
     
+    def _warm_up_args(self, n_words: int) -> tuple:
+        """Scratch arguments for one kernel step, typed like evolve()'s."""
+        state = np.zeros(n_words, dtype=np.uint64)
+        return (
+            state, np.empty_like(state), self.width, 0, 1,
+            self._entropy_table,
+            np.empty(2), np.empty(2),
+            np.zeros(6), True, np.zeros((2, n_words), dtype=np.uint64),
+            self._n_tiles
+        )
+    
     def evolve(self, initial_condition: str = 'single',
                center_position: Optional[int] = None,
-               show_progress: bool = True) -> Dict[str, Any]:
+               show_progress: bool = True,
+               keep_grid: bool = True) -> Dict[str, Any]:
         """
         Evolve Rule 30 cellular automaton.
         
@@ -128,6 +510,8 @@ class Rule30Solver:
             initial_condition: Always 'single' for pyramid patterns
             center_position: Position for single cell (auto if None)
             show_progress: Show progress bar
+            keep_grid: Retain the full evolution history (needed for
+                plots and NetCDF grids); if False only metrics are kept
         
         Returns:
             Dictionary with results
@@ -141,39 +525,59 @@ class Rule30Solver:
             center_position = width // 2
         state[center_position] = 1
         
-        # Storage
-        grid = np.zeros((steps + 1, width), dtype=np.int8)
-        grid[0] = state
+        # Bit-packed storage: 64 cells per uint64 word
+        n_words = (width + 63) // 64
+        if keep_grid:
+            grid_packed = np.zeros((steps + 1, n_words), dtype=np.uint64)
+        else:
+            grid_packed = np.zeros((0, n_words), dtype=np.uint64)
+        
+        entropy_values = np.empty(steps + 1)
+        complexity_values = np.empty(steps + 1)
+        stats = np.zeros(6)
         
         if self.verbose:
             print(f"  Initial condition: single center cell")
             print(f"  Center position: {center_position}")
         
-        # Evolution loop
+        # Fused evolution + entropy/complexity, run in ~100 jitted chunks
+        # so the progress bar can update without per-step dispatch
+        final_state = pack_state(state)
+        scratch = np.empty_like(final_state)
+        
         if show_progress:
-            pbar = tqdm(range(steps), desc="  Evolving CA", unit=" steps")
+            chunk = max(1, steps // 100)
+            pbar = tqdm(total=steps, desc="  Evolving CA", unit=" steps")
         else:
-            pbar = range(steps)
+            chunk = max(1, steps)
         
-        for t in pbar:
-            state = apply_rule30(state)
-            grid[t + 1] = state
+        with _num_threads(self.n_cores):
+            for t0 in range(0, max(1, steps), chunk):
+                t1 = min(t0 + chunk, steps)
+                self._evolve_kernel(
+                    final_state, scratch, width, t0, t1, self._entropy_table,
+                    entropy_values, complexity_values, stats,
+                    keep_grid, grid_packed, self._n_tiles
+                )
+                if show_progress:
+                    pbar.update(t1 - t0)
         
-        if show_progress and isinstance(pbar, tqdm):
+        if show_progress:
             pbar.close()
         
-        # Compute metrics in parallel
-        if self.verbose:
-            print("  Computing entropy & complexity...")
-        
-        entropy_values, complexity_values = compute_metrics_parallel(grid)
+        if keep_grid:
+            grid = unpack_grid(grid_packed, width)
+        else:
+            grid = None
+            grid_packed = None
         
-        # Compute statistics
-        mean_entropy = np.mean(entropy_values)
-        std_entropy = np.std(entropy_values)
-        mean_complexity = np.mean(complexity_values)
-        std_complexity = np.std(complexity_values)
-        final_density = np.sum(grid[-1]) / width
+        # Statistics accumulated during evolution (population std)
+        n_rows = stats[STAT_COUNT]
+        mean_entropy = stats[STAT_MEAN_E]
+        std_entropy = np.sqrt(stats[STAT_M2_E] / n_rows)
+        mean_complexity = stats[STAT_MEAN_C]
+        std_complexity = np.sqrt(stats[STAT_M2_C] / n_rows)
+        final_density = stats[STAT_N_ONES] / width
         
         if self.verbose:
             print(f"  Final entropy: {entropy_values[-1]:.4f}")
@@ -183,6 +587,7 @@ class Rule30Solver:
         
         return {
             'grid': grid,
+            'grid_packed': grid_packed,
             'entropy': entropy_values,
             'complexity': complexity_values,
             'mean_entropy': mean_entropy,
@@ -4,7 +4,6 @@ import numpy as np
 from netCDF4 import Dataset
 from pathlib import Path
 from datetime import datetime
-import csv
 
 
 class DataHandler:
@@ -27,6 +26,11 @@ class DataHandler:
             nc.createDimension('x', width)
             nc.createDimension('time', steps + 1)
             
+            # Row-band chunks match the single whole-array write; low
+            # deflate levels are much faster for a negligible size cost
+            grid_chunks = (min(steps + 1, 64), (width + 7) // 8)
+            series_chunks = (min(steps + 1, 4096),)
+            
             # Coordinates
             nc_x = nc.createVariable('x', 'i4', ('x',), zlib=True, complevel=4)
             nc_x[:] = np.arange(width)
@@ -38,24 +42,46 @@ class DataHandler:
             nc_t.units = "time_step"
             nc_t.long_name = "temporal_coordinate"
             
-            # Grid evolution
-            nc_grid = nc.createVariable('grid', 'i1', ('time', 'x'),
-                                       zlib=True, complevel=6)
-            nc_grid[:] = result['grid']
-            nc_grid.units = "state"
-            nc_grid.long_name = "cellular_automaton_state"
-            nc_grid.description = "0=dead, 1=alive"
+            # Grid evolution, 8 cells per byte (omitted when the history
+            # was not retained)
+            if result['grid'] is not None:
+                x_packed = (width + 7) // 8
+                nc.createDimension('x_packed', x_packed)
+                
+                if result.get('grid_packed') is not None:
+                    # Big-endian bytes of the MSB-first solver words are
+                    # exactly np.packbits of the rows
+                    packed = np.ascontiguousarray(
+                        result['grid_packed'], dtype='>u8'
+                    ).view(np.uint8)[:, :x_packed]
+                else:
+                    packed = np.packbits(result['grid'], axis=1)
+                
+                # Every byte value is a valid packed row, so no fill value
+                nc_grid = nc.createVariable('grid', 'u1', ('time', 'x_packed'),
+                                           zlib=True, complevel=1,
+                                           chunksizes=grid_chunks,
+                                           fill_value=False)
+                nc_grid[:] = packed
+                nc_grid.units = "state"
+                nc_grid.long_name = "cellular_automaton_state"
+                nc_grid.description = "0=dead, 1=alive; bit-packed, see unpack_grid"
+                nc_grid.bits_per_element = 1
+                nc_grid.original_width = width
+                nc_grid.packing_convention = "msb_first"
             
             # Entropy
             nc_entropy = nc.createVariable('entropy', 'f4', ('time',),
-                                          zlib=True, complevel=4)
+                                          zlib=True, complevel=1,
+                                          chunksizes=series_chunks)
             nc_entropy[:] = result['entropy']
             nc_entropy.units = "bits"
             nc_entropy.long_name = "shannon_entropy"
             
             # Complexity
             nc_complexity = nc.createVariable('complexity', 'f4', ('time',),
-                                             zlib=True, complevel=4)
+                                             zlib=True, complevel=1,
+                                             chunksizes=series_chunks)
             nc_complexity[:] = result['complexity']
             nc_complexity.units = "normalized"
             nc_complexity.long_name = "local_complexity"
@@ -82,23 +108,48 @@ class DataHandler:
             nc.Conventions = "CF-1.8"
             nc.title = f"Rule 30 Simulation: {metadata.get('scenario_name', 'unknown')}"
     
+    @staticmethod
+    def unpack_grid(nc_var) -> np.ndarray:
+        """Unpack a bit-packed NetCDF grid variable to int8 (time, x)."""
+        width = int(nc_var.original_width)
+        packed = np.asarray(nc_var[:], dtype=np.uint8)
+        return np.unpackbits(packed, axis=1, count=width).view(np.int8)
+    
+    @staticmethod
+    def _write_csv(filepath: Path, header: str, columns: list):
+        """Write pre-formatted string columns as one buffered CSV write."""
+        lines = [','.join(row) + '\n' for row in zip(*columns)]
+        with open(filepath, 'w') as f:
+            f.write(header + '\n')
+            f.writelines(lines)
+    
     @staticmethod
     def save_csv(base_filename: str, result: dict, metadata: dict,
                  output_dir: str = "outputs"):
         """
         Save entropy and complexity time series to CSV files.
         
-        Creates three CSV files:
+        With csv_mode = 'composite' (default) only one file is written,
+        and its path is returned in all three slots:
+        - {base_filename}_composite.csv: Time step, entropy, and complexity
+        
+        With csv_mode = 'all' two single-metric files are added:
         - {base_filename}_entropy.csv: Time step and entropy values
         - {base_filename}_complexity.csv: Time step and complexity values
-        - {base_filename}_composite.csv: Time step, entropy, and complexity
         
         Args:
             base_filename: Base name for output files (without extension)
             result: Simulation results dictionary
-            metadata: Metadata dictionary
+            metadata: Metadata dictionary (reads 'csv_mode')
             output_dir: Output directory path
+        
+        Returns:
+            Tuple of (entropy_file, complexity_file, composite_file)
         """
+        csv_mode = metadata.get('csv_mode', 'composite')
+        if csv_mode not in ('composite', 'all'):
+            raise ValueError(f"Unknown csv_mode: {csv_mode}")
+        
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
@@ -106,33 +157,25 @@ class DataHandler:
         if base_filename.endswith('.nc'):
             base_filename = base_filename[:-3]
         
+        # Format each column once and share it between files
         steps = result['params']['steps']
-        time_array = np.arange(steps + 1)
-        entropy = result['entropy']
-        complexity = result['complexity']
+        time_col = np.char.mod('%d', np.arange(steps + 1))
+        entropy_col = np.char.mod('%.8f', result['entropy'])
+        complexity_col = np.char.mod('%.8f', result['complexity'])
+        
+        composite_file = output_path / f"{base_filename}_composite.csv"
+        DataHandler._write_csv(composite_file, 'time_step,entropy,complexity',
+                               [time_col, entropy_col, complexity_col])
+        
+        if csv_mode == 'composite':
+            return composite_file, composite_file, composite_file
         
-        # 1. Save entropy CSV
         entropy_file = output_path / f"{base_filename}_entropy.csv"
-        with open(entropy_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['time_step', 'entropy'])
-            for t, ent in zip(time_array, entropy):
-                writer.writerow([t, f'{ent:.8f}'])
+        DataHandler._write_csv(entropy_file, 'time_step,entropy',
+                               [time_col, entropy_col])
         
-        # 2. Save complexity CSV
         complexity_file = output_path / f"{base_filename}_complexity.csv"
-        with open(complexity_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['time_step', 'complexity'])
-            for t, comp in zip(time_array, complexity):
-                writer.writerow([t, f'{comp:.8f}'])
-        
-        # 3. Save composite CSV
-        composite_file = output_path / f"{base_filename}_composite.csv"
-        with open(composite_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['time_step', 'entropy', 'complexity'])
-            for t, ent, comp in zip(time_array, entropy, complexity):
-                writer.writerow([t, f'{ent:.8f}', f'{comp:.8f}'])
+        DataHandler._write_csv(complexity_file, 'time_step,complexity',
+                               [time_col, complexity_col])
         
         return entropy_file, complexity_file, composite_file
@@ -3,13 +3,51 @@
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from PIL import Image
 from pathlib import Path
 import matplotlib as mpl
 
 mpl.rcParams['font.family'] = 'sans-serif'
 mpl.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
 
+# Figures reused across plots of the same size (e.g. --all runs)
+_FIGURES = {}
+
+
+def _get_figure(fig_width: float, fig_height: float) -> Figure:
+    """Return a cleared, cached figure with constrained layout."""
+    key = (fig_width, fig_height)
+    fig = _FIGURES.get(key)
+    if fig is None:
+        fig = Figure(figsize=key, constrained_layout=True)
+        _FIGURES[key] = fig
+    else:
+        fig.clear()
+    return fig
+
+
+def _block_reduce(grid: np.ndarray, max_rows: int, max_cols: int) -> np.ndarray:
+    """
+    Average ky x kx blocks so the grid fits within max_rows x max_cols.
+    Partial blocks at the bottom/right edges are averaged over the cells
+    they hold, so the image still covers the whole grid.
+    """
+    rows, cols = grid.shape
+    ky = max(1, int(np.ceil(rows / max_rows)))
+    kx = max(1, int(np.ceil(cols / max_cols)))
+    if ky == 1 and kx == 1:
+        return grid
+    
+    # Zero-pad to whole blocks, then divide by the real cell counts
+    rows_k, cols_k = -(-rows // ky), -(-cols // kx)
+    padded = np.pad(grid, ((0, rows_k * ky - rows), (0, cols_k * kx - cols)))
+    sums = padded.reshape(rows_k, ky, cols_k, kx).sum(axis=(1, 3),
+                                                      dtype=np.int64)
+    counts = np.outer(np.minimum(ky, rows - np.arange(rows_k) * ky),
+                      np.minimum(kx, cols - np.arange(cols_k) * kx))
+    return sums / counts
+
 
 class Plotter:
     """Clean plotter for Rule 30 spatio-temporal evolution."""
@@ -21,6 +59,9 @@ class Plotter:
         Create clean plot of Rule 30 evolution - ONLY the CA evolution.
         No title, no subplots, no stats boxes.
         
+        Grids with more cells than output pixels are block-averaged
+        before rasterization; the requested DPI is always honoured.
+        
         Args:
             result: Simulation results dictionary
             filename: Output filename (e.g., 'case1.png')
@@ -56,14 +97,20 @@ class Plotter:
         fig_width = max(fig_width, 10)
         fig_height = max(fig_height, 8)
         
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
+        # Don't hand imshow more cells than the output has pixels
+        image = _block_reduce(grid, int(fig_height * dpi), int(fig_width * dpi))
+        
+        fig = _get_figure(fig_width, fig_height)
+        ax = fig.add_subplot()
         
         # Use specified colormap
-        cmap = plt.cm.get_cmap(colormap)
+        cmap = mpl.colormaps[colormap]
         
         # Plot with nearest neighbor to preserve sharp pixels
-        im = ax.imshow(grid, cmap=cmap, interpolation='nearest', 
-                      aspect='auto', origin='upper')
+        # Extent keeps axes in cell/step units if the image was reduced
+        im = ax.imshow(image, cmap=cmap, interpolation='nearest', 
+                      aspect='auto', origin='upper', vmin=0, vmax=1,
+                      extent=(-0.5, width - 0.5, steps - 0.5, -0.5))
         
         # Clean axes
         ax.set_xlabel('Cell Index', fontsize=14, fontweight='bold')
@@ -71,17 +118,54 @@ class Plotter:
         ax.tick_params(labelsize=12)
         
         # Add subtle colorbar
-        cbar = plt.colorbar(im, ax=ax, fraction=0.03, pad=0.02)
+        cbar = fig.colorbar(im, ax=ax, fraction=0.03, pad=0.02)
         cbar.set_label('State', fontsize=12, fontweight='bold')
         cbar.ax.tick_params(labelsize=11)
         
-        # Tight layout to avoid cutting off labels
-        plt.tight_layout()
-        
-        # Save with high DPI and no extra whitespace
-        plt.savefig(filepath, dpi=dpi, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none', pad_inches=0.1)
-        plt.close(fig)
+        # Constrained layout keeps labels inside the figure, so a single
+        # render pass is enough (no tight_layout / bbox_inches='tight')
+        fig.savefig(filepath, dpi=dpi, facecolor='white', edgecolor='none')
+        # Drop the artists so the cached figure doesn't pin the image
+        fig.clear()
         
         file_size_mb = filepath.stat().st_size / 1024 / 1024
         print(f"       ✓ Saved: {filepath} ({file_size_mb:.1f} MB, {dpi} DPI)")
+    
+    @staticmethod
+    def create_plot_fast(result: dict, filename: str,
+                         output_dir: str = "outputs"):
+        """
+        Write the Rule 30 evolution as a 1-bit PNG via Pillow, one pixel
+        per cell (live = black). No axes or colorbar; use create_plot
+        for publication figures.
+        
+        Args:
+            result: Simulation results dictionary
+            filename: Output filename (e.g., 'case1.png')
+            output_dir: Output directory path
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        filepath = output_path / filename
+        
+        width = result['params']['width']
+        steps = result['params']['steps']
+        row_bytes = (width + 7) // 8
+        
+        if result.get('grid_packed') is not None:
+            # MSB-first solver words are already Pillow's 1-bit row layout
+            packed = np.ascontiguousarray(
+                result['grid_packed'], dtype='>u8'
+            ).view(np.uint8)[:, :row_bytes]
+        else:
+            packed = np.packbits(result['grid'], axis=1)
+        
+        # '1;I' = inverted 1-bit raw data, so set bits are drawn black
+        img = Image.frombytes('1', (width, steps + 1),
+                              np.ascontiguousarray(packed).tobytes(),
+                              'raw', '1;I')
+        img.save(filepath, optimize=True)
+        
+        file_size_mb = filepath.stat().st_size / 1024 / 1024
+        print(f"       ✓ Saved: {filepath} ({file_size_mb:.1f} MB, "
+              f"{width}x{steps + 1} px)")